@@ -1,10 +1,12 @@
 import pandas as pd
 import numpy as np
+import numpy.typing as npt
 import math
 from enum import Enum
+from typing import Tuple
 from pathlib import Path
 
-from ..utilities import get_hourly_shares, calculate_occupants
+from ..utilities import load_hourly_share_fractions, calculate_occupants
 
 
 here = Path(__file__).parent
@@ -21,6 +23,25 @@ class OvenType(Enum):
     ELECTRIC = 1
 
 
+# Cooking coefficients, read once at import into (factor, constant) pairs keyed by appliance type.
+_coefficients = pd.read_csv(here / "reference_data/cooking_coefficients_rev10.1.csv", index_col="variable")
+
+_COOKTOP_COEFFICIENTS = {
+    cooktop_type: (float(_coefficients[column].loc['factor']), float(_coefficients[column].loc['constant']))
+    for cooktop_type, column in [(CooktopType.GAS, 'gas cooktop'),
+                                 (CooktopType.ELECTRIC, 'electric cooktop'),
+                                 (CooktopType.INDUCTION, 'induction cooktop')]
+}
+
+_OVEN_COEFFICIENTS = {
+    oven_type: (float(_coefficients[column].loc['factor']), float(_coefficients[column].loc['constant']))
+    for oven_type, column in [(OvenType.GAS, 'gas oven'),
+                              (OvenType.ELECTRIC, 'electric oven')]
+}
+
+HOURLY_SHARES = load_hourly_share_fractions(here / 'reference_data/cooking_hourly_share_rev10.1.csv')
+
+
 def calculate_cooktop_annual_load(occupants: float, cooktop_type: CooktopType) -> float:
     """
 
@@ -29,21 +50,11 @@ def calculate_cooktop_annual_load(occupants: float, cooktop_type: CooktopType) -
     :return: Plug load in MJ/yr
     """
 
-
-    coefficients = pd.read_csv(here / "reference_data/cooking_coefficients_rev10.1.csv", index_col="variable")
-
-    if cooktop_type == CooktopType.GAS:
-        f = coefficients['gas cooktop'].loc['factor']
-        c = coefficients['gas cooktop'].loc['constant']
-    elif cooktop_type == CooktopType.ELECTRIC:
-        f = coefficients['electric cooktop'].loc['factor']
-        c = coefficients['electric cooktop'].loc['constant']
-    elif cooktop_type == CooktopType.INDUCTION:
-        f = coefficients['induction cooktop'].loc['factor']
-        c = coefficients['induction cooktop'].loc['constant']
-    else:
+    if cooktop_type not in _COOKTOP_COEFFICIENTS:
         raise NotImplementedError
 
+    f, c = _COOKTOP_COEFFICIENTS[cooktop_type]
+
     return c + (occupants * f)
 
 
@@ -55,28 +66,32 @@ def calculate_oven_annual_load(occupants: float, oven_type: OvenType) -> float:
     :return: Plug load in MJ/yr
     """
 
-    coefficients = pd.read_csv(here / "reference_data/cooking_coefficients_rev10.1.csv", index_col="variable")
-
-    if oven_type == OvenType.GAS:
-        f = coefficients['gas oven'].loc['factor']
-        c = coefficients['gas oven'].loc['constant']
-    elif oven_type == OvenType.ELECTRIC:
-        f = coefficients['electric oven'].loc['factor']
-        c = coefficients['electric oven'].loc['constant']
-    else:
+    if oven_type not in _OVEN_COEFFICIENTS:
         raise NotImplementedError
 
+    f, c = _OVEN_COEFFICIENTS[oven_type]
+
     return c + (occupants * f)
 
 
-def calculate_hourly_energy_demand(dwelling_area: float, cooktop_type: CooktopType, oven_type: OvenType) -> ([float], [float]):
+def calculate_hourly_energy_demand(dwelling_area: float,
+                                   cooktop_type: CooktopType,
+                                   oven_type: OvenType,
+                                   dtype: npt.DTypeLike = np.float64) -> Tuple[npt.NDArray[float], npt.NDArray[float]]:
+    """
+
+    :param dwelling_area: Floor area of all zones, excluding garage.
+    :param cooktop_type: Cooktop type
+    :param oven_type: Oven type
+    :param dtype: Float type of result, e.g. np.float32 to halve memory when aggregating many dwellings
+    :return: Hourly cooktop and oven loads in MJ (8760 points each)
+    """
 
     occupants = calculate_occupants(dwelling_area)
     annual_cooktop_load = calculate_cooktop_annual_load(occupants, cooktop_type)
     annual_oven_load = calculate_oven_annual_load(occupants, oven_type)
-    hourly_shares = get_hourly_shares(here / 'reference_data/cooking_hourly_share_rev10.1.csv')
 
-    hourly_cooktop_annual_load = hourly_shares * annual_cooktop_load / 100
-    hourly_oven_annual_load = hourly_shares * annual_oven_load / 100
+    hourly_cooktop_annual_load = np.multiply(HOURLY_SHARES, annual_cooktop_load, dtype=dtype)
+    hourly_oven_annual_load = np.multiply(HOURLY_SHARES, annual_oven_load, dtype=dtype)
 
     return hourly_cooktop_annual_load, hourly_oven_annual_load
@@ -1,10 +1,20 @@
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 import logging
 import math
 import pandas as pd
+from pathlib import Path
+
+from ..utilities import get_nathers_zone
+
+
+here = Path(__file__).parent
+
+# GEMS zone by NatHERS climate zone, loaded once at import rather than on every call.
+_GEMS_ZONES = pd.read_csv(here / 'reference_data/nathers_and_gems_zones_rev10.1.csv',
+                          index_col='NatHERS Climate Zone')['Applicable GEMS ZERL Zone'].to_dict()
 
-from utilities import get_nathers_zone
 
 class HeatingCoolingType(Enum):
     AC = 0              # Cooling only
@@ -22,6 +32,11 @@ class HeatingCoolingLossType(Enum):
     NON_DUCTED = 4
 
 
+_DUCTED_LOSS_TYPES = frozenset({HeatingCoolingLossType.DUCTED_OLD, HeatingCoolingLossType.DUCTED_NEW})
+_COOLING_ONLY_TYPES = frozenset({HeatingCoolingType.AC, HeatingCoolingType.EVAPORATIVE})
+_HEATING_ONLY_TYPES = frozenset({HeatingCoolingType.WOOD, HeatingCoolingType.GAS})
+
+
 LOSS_FACTORS = {
     HeatingCoolingLossType.DUCTED_NEW: 0.15,
     HeatingCoolingLossType.DUCTED_OLD: 0.25,
@@ -31,27 +46,42 @@ LOSS_FACTORS = {
 }
 
 
+# COP of gas heaters by star rating (x10, in half star increments from 1 to 6 stars)
+GAS_DUCTED_COPS = {
+    # Equation 22 up to 3 stars, equation 23 above
+    int(star_rating * 10): 0.4 + (0.1 * star_rating) if star_rating <= 3
+    else 0.357892 + (0.3114 * math.log(star_rating))
+    for star_rating in (x / 2 for x in range(2, 13))
+}
+
+GAS_NON_DUCTED_COPS = {
+    int(star_rating * 10): 0.61 + (0.06 * (star_rating - 1))
+    for star_rating in (x / 2 for x in range(2, 13))
+}
+
+
+# Default heat pump star ratings by GEMS zone, from table 13
+DEFAULT_STAR_RATINGS = {
+    "Hot/humid": {"heating": 4.0, "cooling": 4.0},
+    "Mixed": {"heating": 3.5, "cooling": 3.5},
+    "Cold": {"heating": 2.5, "cooling": 3.5}
+}
+
+
+@lru_cache(maxsize=None)
 def get_gems_zone(postcode: int) -> str:
     nathers_zone = get_nathers_zone(postcode)
-    gems_zone_data = pd.read_csv('heating_cooling/reference_data/nathers_and_gems_zones_rev10.1.csv',
-                                 index_col='NatHERS Climate Zone')
-    return gems_zone_data.loc[nathers_zone]['Applicable GEMS ZERL Zone']
+    return _GEMS_ZONES[nathers_zone]
 
 
 def get_default_star_rating(postcode: int):
-    # From table 13
-
     gems_zone = get_gems_zone(postcode)
 
-    if gems_zone == "Hot/humid":
-        return {"heating": 4.0, "cooling": 4.0}
-    elif gems_zone == "Mixed":
-        return {"heating": 3.5, "cooling": 3.5}
-    elif gems_zone == "Cold":
-        return {"heating": 2.5, "cooling": 3.5}
-    else:
+    if gems_zone not in DEFAULT_STAR_RATINGS:
         raise AssertionError
 
+    return dict(DEFAULT_STAR_RATINGS[gems_zone])
+
 
 def calculate_hourly_energy_demand(postcode,
                                    heating_load,
@@ -66,20 +96,21 @@ def calculate_hourly_energy_demand(postcode,
     # Get coefficient of performance COP for appliance
     if heating_cooling_type == HeatingCoolingType.GAS:
 
-        if loss_type in [HeatingCoolingLossType.DUCTED_OLD, HeatingCoolingLossType.DUCTED_NEW]:
-            if heating_star_rating is None:
-                logging.info("Gas star rating not provided, defaulting to 3.")
-                star_rating = 3
-            if heating_star_rating <= 3:
-                # Equation 22
-                cop_a = 0.4 + (0.1 * star_rating)
-            elif 3 < star_rating <= 6:
-                # Equation 23
-                cop_a = 0.357892 + (0.3114 * math.log(star_rating))
-            else:
-                raise NotImplementedError("Invalid gas star rating.")
+        if heating_star_rating is None:
+            logging.info("Gas star rating not provided, defaulting to 3.")
+            heating_star_rating = 3
+
+        if loss_type in _DUCTED_LOSS_TYPES:
+            gas_cops = GAS_DUCTED_COPS
         else:
-            cop_a = 0.61 + (0.06 * (heating_star_rating - 1))
+            gas_cops = GAS_NON_DUCTED_COPS
+
+        # Star ratings in half star increments, i.e. 4.5 star becomes 45
+        star_rating_code = int(heating_star_rating * 10)
+        if star_rating_code not in gas_cops or star_rating_code != heating_star_rating * 10:
+            raise NotImplementedError("Invalid gas star rating.")
+
+        cop_a = gas_cops[star_rating_code]
 
     elif heating_cooling_type == HeatingCoolingType.WOOD:
         # TODO: Optionally allow user efficiency value based on AS/NZS 4012
@@ -103,10 +134,10 @@ def calculate_hourly_energy_demand(postcode,
     if heating_cooling_type == HeatingCoolingType.HEAT_PUMP:
         # Heating and cooling
         pass
-    elif heating_cooling_type in [HeatingCoolingType.AC, HeatingCoolingType.EVAPORATIVE]:
+    elif heating_cooling_type in _COOLING_ONLY_TYPES:
         # Cooling only
         pass
-    elif heating_cooling_type in [HeatingCoolingType.WOOD, HeatingCoolingType. GAS]:
+    elif heating_cooling_type in _HEATING_ONLY_TYPES:
         # Heating only
         pass
     else:
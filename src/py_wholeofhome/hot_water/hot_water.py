@@ -3,16 +3,114 @@ import logging
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
-import math
 from enum import Enum
-from typing import Optional, Tuple, Union
-from calendar import monthrange
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Union
 from pathlib import Path
 
-from ..utilities import calculate_occupants
+from ..utilities import calculate_occupants, cache_read_only, MONTH_LENGTHS, MONTH_OF_DAY
 
 here = Path(__file__).parent
 
+
+def _load_postcode_zones(reference_file: Path) -> Tuple[npt.NDArray[int], npt.NDArray[int], npt.NDArray[int]]:
+    """
+    Load a table of postcode ranges and climate zones, sorted by start of range so zones can be found by binary search.
+
+    :param reference_file: CSV with from_postcode, to_postcode and zone columns.
+    :return: Arrays of range start postcodes, range end postcodes and (small integer) zones.
+    """
+
+    data = pd.read_csv(reference_file).sort_values('from_postcode')
+
+    # Heat pump zones are verbose, e.g. HP5-AU for 5 -- strip this out.
+    zones = np.array([int(str(zone).replace("HP", "").replace("-AU", "")) for zone in data['zone']], dtype=np.int8)
+
+    return data['from_postcode'].to_numpy(), data['to_postcode'].to_numpy(), zones
+
+
+def _load_annual_energy_coefficients(reference_file: Path) -> Tuple[Dict[str, Optional[npt.NDArray[float]]],
+                                                                      Dict[Tuple[str, int], Dict[int, str]]]:
+    """
+    Load annual purchased energy coefficients into plain dicts, so lookups don't need to go through pandas.
+
+    :param reference_file: CSV of coefficients by System ID.
+    :return: Coefficients [a, b, c, d] by System ID (None where the table has no coefficients), and System IDs by
+    STC count for each (type, climate zone) pair, for types that have STC counts.
+    """
+
+    data = pd.read_csv(reference_file, index_col="System ID")
+
+    coefficients = {}
+    system_ids_by_stc = {}
+
+    for system_id, row in data.iterrows():
+        # A handful of entries don't have coefficients (just have string for 'a', 'b', 'c', 'd' instead).
+        try:
+            coefficients[system_id] = np.array([float(row['a']), float(row['b']), float(row['c']), float(row['d'])])
+        except ValueError:
+            coefficients[system_id] = None
+
+        if not pd.isna(row['STCs']):
+            system_ids_by_stc.setdefault((system_id[0:3], int(row['Climate'])), {})[int(row['STCs'])] = system_id
+
+    return coefficients, system_ids_by_stc
+
+
+def _load_coefficients(reference_file: Path, columns: [str], suffixes: [str]) -> Dict[str, npt.NDArray[float]]:
+    """
+    Load cubic coefficients from a reference table into a plain dict, grouped into one array per system, so lookups
+    don't need to go through pandas.
+
+    :param reference_file: CSV of coefficients by System ID.
+    :param columns: Names of columns holding coefficients a, b, c, d.
+    :param suffixes: Last part of System ID for each row in a group, in order, e.g. months, or hourly components.
+    :return: Array of coefficients [a, b, c, d] for each suffix, by System ID prefix (e.g. "SHP-4" for SHP-4-JAN etc.)
+    """
+
+    data = pd.read_csv(reference_file, index_col="System ID")
+
+    coefficients = dict(zip(data.index, data[columns].to_numpy(dtype=float)))
+    prefixes = {system_id.rsplit('-', 1)[0] for system_id in coefficients}
+
+    return {prefix: np.array([coefficients[f'{prefix}-{suffix}'] for suffix in suffixes]) for prefix in prefixes}
+
+
+# Reference data tables, loaded once at import rather than on every call.
+_ANNUAL_ENERGY_COEFFICIENTS, _ANNUAL_ENERGY_SYSTEM_IDS_BY_STC = _load_annual_energy_coefficients(
+    here / "reference_data/hw_annual_energy_by_climate_zone_rev10.1.csv")
+# Heat pumps have their own climate zones (with different postcode ranges), everything else shares the general ones.
+_CLIMATE_ZONES = {
+    'general': _load_postcode_zones(here / 'reference_data/hw_climate_zones_rev10.1.csv'),
+    'heatpump': _load_postcode_zones(here / 'reference_data/hw_heat_pump_climate_zones_rev10.1.csv'),
+}
+_MONTHLY_SHARE_COEFFICIENTS = _load_coefficients(here / "reference_data/hw_monthly_share_rev10.1.csv",
+                                                 ['a-month', 'b-month', 'c-month', 'd-month'],
+                                                 ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN',
+                                                  'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC'])
+_HOURLY_COEFFICIENTS = _load_coefficients(here / "reference_data/hw_hourly_coefficients_rev10.1.csv",
+                                          ['ax', 'bx', 'cx', 'dx'],
+                                          ['A', 'B', 'C', 'D'])
+# Hourly profiles by column name, ordered by 'Nominal hour number' (which starts at 1 rather than 0)
+_HOURLY_PROFILES = {column: values.to_numpy() for column, values in
+                    pd.read_csv(here / "reference_data/hw_hourly_profiles_rev10.1.csv",
+                                index_col="Nominal hour number").sort_index().items()}
+# These are handed straight back by calculate_hourly_share, so shouldn't be modifiable
+for _profile in _HOURLY_PROFILES.values():
+    _profile.setflags(write=False)
+
+# Hours of day for which each component (A, B, C, D) of the storage hourly share model applies (note that 1 = midnight),
+# mapped to an index of the component for each hour.
+_HOURS_BY_COMPONENT = [[1, 2, 3, 4, 5, 6, 7, 10, 11, 13, 15, 20, 21, 22, 23, 24],
+                       [12, 14],
+                       [16, 17, 18, 19],
+                       [8, 9]]
+_HOUR_COMPONENTS = np.array([next(component for component, hours in enumerate(_HOURS_BY_COMPONENT) if hour in hours)
+                             for hour in range(1, 25)])
+
+# Litres of water per MJ for 1MJ peak load, for climate zones 1 to 5
+_PEAK_LITRES_PER_MJ = np.array([6.144, 5.482, 5.107, 4.746, 4.514])
+
 class HotWaterType(Enum):
     SOLID_FUEL = 0
     ELECTRIC_STORAGE_SMALL = 1
@@ -36,22 +134,90 @@ class EnergisationSchedule(Enum):
     CONTINUOUS = 3      # Or always on, demand depends on hot water usage.
 
 
+# Abbreviations used for each hot water type in System IDs of the reference data tables
+_HW_TYPE_PREFIXES = {
+    HotWaterType.SOLID_FUEL: "SOF",
+    HotWaterType.ELECTRIC_STORAGE_SMALL: "ESS",
+    HotWaterType.ELECTRIC_STORAGE_LARGE: "ESL",
+    HotWaterType.ELECTRIC_INSTANTANEOUS: "ESI",
+    HotWaterType.GAS_STORAGE: "GST",
+    HotWaterType.GAS_INSTANTANEOUS: "GIN",
+    HotWaterType.SOLAR_ELECTRIC: "STE",
+    HotWaterType.SOLAR_GAS: "STG",
+    HotWaterType.HEAT_PUMP: "SHP",
+}
+
+# Types where the last part of the System ID is the gas star rating or STC count (otherwise it's 00)
+_HW_TYPES_USING_GAS_STAR_RATING = frozenset({HotWaterType.GAS_STORAGE, HotWaterType.GAS_INSTANTANEOUS})
+_HW_TYPES_USING_STC_COUNT = frozenset({HotWaterType.SOLAR_GAS, HotWaterType.SOLAR_ELECTRIC, HotWaterType.HEAT_PUMP})
+
+# Monthly share prefixes for gas boosted solar, which has separate shares for electricity (STX) and gas (STG) that
+# don't add up to 1 on their own.
+_SOLAR_GAS_SHARE_TYPES = frozenset({'STX', 'STG'})
+
+# Only solar thermal monthly shares vary with demand (other types just have coefficient d), so check the rest add up
+# to 1 once here, rather than on every call.
+_DEMAND_DEPENDENT_MONTHLY_SHARES = frozenset(prefix for prefix, coefficients in _MONTHLY_SHARE_COEFFICIENTS.items()
+                                             if coefficients[:, :3].any())
+for _prefix, _coefficients in _MONTHLY_SHARE_COEFFICIENTS.items():
+    if _prefix not in _DEMAND_DEPENDENT_MONTHLY_SHARES and abs(_coefficients[:, 3].sum() - 1.0) > 0.005:
+        raise RuntimeError(f"Monthly shares for {_prefix} don't add up to 1")
+
+# Hourly shares for fixed energisation schedules, whatever the hot water type
+_SCHEDULED_HOURLY_SHARES = {
+    EnergisationSchedule.DAYTIME: _HOURLY_PROFILES['Daytime energisation by hour (share)'],
+    EnergisationSchedule.OVERNIGHT: _HOURLY_PROFILES['Overnight energisation by hour (share)'],
+}
+
+
+def _hourly_share_by_use(annual_demand: float) -> npt.NDArray[float]:
+    # Purchased energy coupled directly to hot water demand
+    return _HOURLY_PROFILES['Time of Hot Water use by hour (share)']
+
+
+def _hourly_share_by_coefficients(hw_type: HotWaterType):
+    # Hourly share depends on more complex model, not just driven by hot water demand or fixed schedule.
+    return lambda annual_demand: calculate_hourly_performance_by_coefficients(hw_type, annual_demand)
+
+
+_ANY_SCHEDULE = frozenset(EnergisationSchedule)
+_CONTINUOUS_ONLY = frozenset({EnergisationSchedule.CONTINUOUS})
+
+# For each hot water type, energisation schedules it can run to, and hourly share (given annual demand) when running
+# continuously. Allowed schedules of None means the schedule is ignored, and the continuous share always used.
+_HW_DISPATCH = {
+    # Standard unsure about this one, defaults to continuous...
+    HotWaterType.SOLID_FUEL: (None, _hourly_share_by_use),
+    HotWaterType.ELECTRIC_STORAGE_SMALL: (_ANY_SCHEDULE,
+                                          _hourly_share_by_coefficients(HotWaterType.ELECTRIC_STORAGE_SMALL)),
+    # Don't have method for continuous (load dependent) for large electric storage.
+    HotWaterType.ELECTRIC_STORAGE_LARGE: (frozenset(_SCHEDULED_HOURLY_SHARES), None),
+    HotWaterType.ELECTRIC_INSTANTANEOUS: (_CONTINUOUS_ONLY, _hourly_share_by_use),
+    HotWaterType.GAS_STORAGE: (_CONTINUOUS_ONLY, _hourly_share_by_coefficients(HotWaterType.GAS_STORAGE)),
+    HotWaterType.GAS_INSTANTANEOUS: (_CONTINUOUS_ONLY, _hourly_share_by_use),
+    HotWaterType.SOLAR_ELECTRIC: (_ANY_SCHEDULE, _hourly_share_by_use),
+    HotWaterType.SOLAR_GAS: (_CONTINUOUS_ONLY, _hourly_share_by_use),
+    HotWaterType.HEAT_PUMP: (_ANY_SCHEDULE, _hourly_share_by_coefficients(HotWaterType.HEAT_PUMP)),
+    # Special case for gas boosted solar auxiliary load, we're not looking at gas demand, just electricity for pump
+    # and a little bit of idle load. Schedule doesn't matter.
+    HotWaterType._SOLAR_GAS_AUXILIARY: (None, lambda annual_demand: _HOURLY_PROFILES[
+        'Share auxiliary electricity energy for solar thermal gas systems']),
+}
+
+
 def calculate_winter_peak_demand(occupants: float, climate_zone: int) -> float:
     """
     Per Equation 25 (assumes 40 L hot water delivery per occupant).
-    :param occupants:
-    :param climate_zone:
+    :param occupants: Number of occupants (scalar or array)
+    :param climate_zone: Hot water climate zone (scalar or array)
     :return: Winter peak water demand in MJ/day (Kwp)
     """
 
-    # Litres of water per MJ for 1MJ peak load
-    y = {1: 6.144,
-         2: 5.482,
-         3: 5.107,
-         4: 4.746,
-         5: 4.514}
+    climate_zone = np.asarray(climate_zone)
+    if np.any((climate_zone < 1) | (climate_zone > 5)):
+        raise ValueError("Invalid climate zone")
 
-    return 40 * occupants / y[climate_zone]
+    return 40 * occupants / _PEAK_LITRES_PER_MJ[climate_zone - 1]
 
 
 def calculate_annual_demand(winter_peak_demand: float) -> float:
@@ -92,154 +258,164 @@ def get_hot_water_type_code(hw_type: HotWaterType, climate_zone: int, gas_star_r
             raise RuntimeError("Gas star rating must be in 0.5 star increments")
 
     # Need STC count for some types
-    if stc_count is None and hw_type in [HotWaterType.SOLAR_GAS, HotWaterType.SOLAR_ELECTRIC, HotWaterType.HEAT_PUMP]:
+    if stc_count is None and hw_type in _HW_TYPES_USING_STC_COUNT:
         raise RuntimeError("Missing STC count input.")
 
     ### Generate code
-    if hw_type == HotWaterType.SOLID_FUEL:
-        code = f"SOF-{climate_zone}-00"
-    elif hw_type == HotWaterType.ELECTRIC_STORAGE_SMALL:
-        code = f"ESS-{climate_zone}-00"
-    elif hw_type == HotWaterType.ELECTRIC_STORAGE_LARGE:
-        code = f"ESL-{climate_zone}-00"
-    elif hw_type == HotWaterType.ELECTRIC_INSTANTANEOUS:
-        code = f"ESI-{climate_zone}-00"
-    elif hw_type == HotWaterType.GAS_STORAGE:
-        code = f"GST-{climate_zone}-{gas_star_rating_code}"
-    elif hw_type == HotWaterType.GAS_INSTANTANEOUS:
-        code = f"GIN-{climate_zone}-{gas_star_rating_code}"
-    elif hw_type == HotWaterType.SOLAR_ELECTRIC:
-        code = f"STE-{climate_zone}-{stc_count}"
-    elif hw_type == HotWaterType.SOLAR_GAS:
-        code = f"STG-{climate_zone}-{stc_count}"
-    elif hw_type == HotWaterType.HEAT_PUMP:
-        code = f"SHP-{climate_zone}-{stc_count}"
-    else:
+    if hw_type not in _HW_TYPE_PREFIXES:
         raise NotImplementedError
 
-    return code
+    if hw_type in _HW_TYPES_USING_GAS_STAR_RATING:
+        suffix = gas_star_rating_code
+    elif hw_type in _HW_TYPES_USING_STC_COUNT:
+        suffix = stc_count
+    else:
+        suffix = "00"
+
+    return f"{_HW_TYPE_PREFIXES[hw_type]}-{climate_zone}-{suffix}"
 
 
-def calculate_annual_purchased_energy(annual_demand: float, hw_type_code: str) -> float:
+def _evaluate_cubic(coefficients: npt.NDArray[float], x: npt.ArrayLike) -> npt.NDArray[float]:
     """
+    Evaluate cubic a*x^3 + b*x^2 + c*x + d in Horner form, elementwise.
 
-    :param annual_demand:
-    :param hw_type_code:
-    :return: Purchased energy in MJ/yr
+    :param coefficients: [a, b, c, d] along the last axis, e.g. shape (4,) or (N, 4) for one cubic per element of x
+    :param x: Value(s) to evaluate at
+    :return:
     """
 
-    coefficient_data = pd.read_csv(here / "reference_data/hw_annual_energy_by_climate_zone_rev10.1.csv", index_col="System ID")
+    a, b, c, d = np.moveaxis(coefficients, -1, 0)
+    return ((a * x + b) * x + c) * x + d
+
+
+def _get_annual_energy_coefficients(hw_type_code: str) -> npt.NDArray[float]:
+    """
+
+    :param hw_type_code:
+    :return: Coefficients [a, b, c, d] of the annual purchased energy cubic for hw_type_code (or closest match).
+    """
 
     # get relevant data for to match the hw_type_code
     hw_type, climate_zone, stc_count = hw_type_code.split('-')
-    relevant_data = coefficient_data.loc[coefficient_data.index.str.startswith(hw_type)]
-    relevant_data = relevant_data.loc[relevant_data["Climate"] == int(climate_zone)]
-    row = relevant_data.loc[relevant_data["STCs"] == int(stc_count)]
+    system_ids_by_stc = _ANNUAL_ENERGY_SYSTEM_IDS_BY_STC.get((hw_type, int(climate_zone)), {})
+
+    # Try to look up coefficients. There may be no match by STC count due to no values in STCs column.
+    if int(stc_count) in system_ids_by_stc:
+        system_id = system_ids_by_stc[int(stc_count)]
+    elif hw_type_code in _ANNUAL_ENERGY_COEFFICIENTS:
+        system_id = hw_type_code
+    else:
+        # get closest STC code
+        closest_stc = min(system_ids_by_stc, key=lambda x: abs(x - int(stc_count)))
+        system_id = system_ids_by_stc[closest_stc]
+        logging.info(f"No data available for {hw_type_code} - using code {hw_type}-{climate_zone}-{closest_stc} instead")
 
-    # Try to look up coefficients. Row may be empty due to no values in STCs column.
     # It may also fail because a handful of entries don't have coefficients
-    # (just have string for 'a', 'b', 'c', 'd' instead so cast to float will fail).
-    try:
-        if row.empty:
-            if hw_type_code in coefficient_data.index:
-                row = coefficient_data.loc[hw_type_code]
-            else:
-                # get closest STC code
-                closest_stc = int(min(list(relevant_data["STCs"]), key=lambda x:abs(x-int(stc_count))))
-                row = relevant_data.loc[relevant_data["STCs"] == closest_stc]
-                logging.info(f"No data available for {hw_type_code} - using code {hw_type}-{climate_zone}-{closest_stc} instead")
-
-        a, b, c, d = float(row['a']), float(row['b']), float(row['c']), float(row['d'])
-    except TypeError:
+    coefficients = _ANNUAL_ENERGY_COEFFICIENTS[system_id]
+    if coefficients is None:
         raise RuntimeError(f"Missing coefficients for {hw_type_code}")
 
-    return (a * (annual_demand ** 3)) + (b * (annual_demand ** 2)) + (c * annual_demand) + d
+    return coefficients
+
+
+def calculate_annual_purchased_energy(annual_demand: float, hw_type_code: str) -> float:
+    """
+
+    :param annual_demand: Annual hw demand in GJ/yr (scalar or array)
+    :param hw_type_code:
+    :return: Purchased energy in MJ/yr
+    """
+
+    return _evaluate_cubic(_get_annual_energy_coefficients(hw_type_code), annual_demand)
 
 
-def get_climate_zone(postcode: str, hw_type: HotWaterType) -> int:
+def get_climate_zones(postcodes: npt.ArrayLike, hw_type: HotWaterType) -> npt.NDArray[int]:
+    """
+    Get climate zones for many postcodes at once, for a given hot water type.
+    Note these are different to NatHERS climate zones!
+
+    :param postcodes: Australian postcodes, as integers (or strings, which are parsed here).
+    :param hw_type:
+    :return: Array of climate zones
+    """
+
+    postcodes = np.asarray(postcodes)
+    if postcodes.dtype.kind not in 'iu':
+        postcodes = postcodes.astype(int)
+    if not np.all((800 <= postcodes) & (postcodes <= 7470)):
+        raise ValueError("Invalid postcode")
+
+    from_postcodes, to_postcodes, zones = _CLIMATE_ZONES['heatpump' if hw_type == HotWaterType.HEAT_PUMP else 'general']
+
+    # Find the last range starting at or before each postcode, and check the postcode actually falls within it.
+    i = np.searchsorted(from_postcodes, postcodes, side='right') - 1
+    assert np.all(i >= 0) and np.all((from_postcodes[i] <= postcodes) & (postcodes <= to_postcodes[i]))
+
+    return zones[i]
+
+
+@lru_cache(maxsize=None)
+def get_climate_zone(postcode: int, hw_type: HotWaterType) -> int:
     """
     Get climate zone for given postcode and hot water type.
     Note these are different to NatHERS climate zones!
 
-    :param postcode: Australian postcode as string.
+    :param postcode: Australian postcode.
     :param hw_type:
     :return:
     """
 
-    postcode = int(postcode)
     if not (800 <= postcode <= 7470):
         raise ValueError("Invalid postcode")
 
-    if hw_type == HotWaterType.HEAT_PUMP:
-        data = pd.read_csv(here / 'reference_data/hw_heat_pump_climate_zones_rev10.1.csv')
-        result = data[(data['from_postcode'] <= postcode) & (data['to_postcode'] >= postcode)]
-        assert (len(result) == 1)
-        zone = result['zone'].values[0]
-        # Heat pump zones are verbose, e.g. HP5-AU for 5 -- strip this out.
-        zone = int(zone.replace("HP", "").replace("-AU", ""))
+    from_postcodes, to_postcodes, zones = _CLIMATE_ZONES['heatpump' if hw_type == HotWaterType.HEAT_PUMP else 'general']
 
-    else:
-        data = pd.read_csv(here / 'reference_data/hw_climate_zones_rev10.1.csv')
-        result = data[(data['from_postcode'] <= postcode) & (data['to_postcode'] >= postcode)]
-        assert (len(result) == 1)
-        zone = int(result['zone'].values[0])
+    # Single binary search, without building any intermediate arrays for one postcode.
+    i = np.searchsorted(from_postcodes, postcode, side='right') - 1
+    assert i >= 0 and from_postcodes[i] <= postcode <= to_postcodes[i]
 
-    return zone
+    return int(zones[i])
 
 
-def calculate_monthly_share(hw_type_code: str, annual_demand: float) -> [float]:
+def calculate_monthly_share(hw_type_code: str, annual_demand: npt.ArrayLike) -> npt.NDArray[float]:
     """
 
     :param hw_type_code: Code describing hot water type, climate zone, and performance per standard, e.g. SHP-4-30
     :param annual_demand: Annual hot water demand. Only used for solar thermal systems (i.e. coefficiencts a/b/c zero
-    for other types of hot water system).
-    :return: Array with monthly share of HW demand with length of 12.
+    for other types of hot water system). A single demand, or an array of them (e.g. for dwellings in the same zone).
+    :return: Array with monthly share of HW demand with length of 12 (or shape (N, 12) for N demands).
     """
 
-    coefficient_data = pd.read_csv(here / "reference_data/hw_monthly_share_rev10.1.csv",
-                                   index_col="System ID")
-
     # Just grab type and climate zone, e.g. "SHP-4" for "SHP-4-30"
     hw_type_code_prefix = hw_type_code[0:5]
 
-    months = ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']
-
-    monthly_shares = []
-
     # No checking that type code and coefficients exist... assume we've already run calculate_annual_purchased_energy
     # which makes sure hw_type_code is valid.
-    for month in months:
-        hw_type_code_for_month = hw_type_code_prefix + f'-{month}'
-        row = coefficient_data.loc[hw_type_code_for_month]
-        a, b, c, d = float(row['a-month']), float(row['b-month']), float(row['c-month']), float(row['d-month'])
-        monthly_shares.append((a * (annual_demand ** 3)) + (b * (annual_demand ** 2)) + (c * annual_demand) + d)
+    # Evaluate all 12 monthly cubics (January to December) at once, for every demand
+    monthly_shares = _evaluate_cubic(_MONTHLY_SHARE_COEFFICIENTS[hw_type_code_prefix],
+                                     np.asarray(annual_demand)[..., np.newaxis])
 
     # Shares should add up to be close to 1 (within 0.5%, given limited precision in reference data tables)
-    # Except for solar thermal gas, where there are separate shares for electricity/gas contribution
-    if hw_type_code_prefix[0:3] not in ['STX', 'STG']:
-        assert math.isclose(sum(monthly_shares), 1.0, abs_tol=0.005)
+    # Except for solar thermal gas, where there are separate shares for electricity/gas contribution. Shares that
+    # don't depend on demand were already checked when loaded.
+    if (hw_type_code_prefix in _DEMAND_DEPENDENT_MONTHLY_SHARES
+            and hw_type_code_prefix[0:3] not in _SOLAR_GAS_SHARE_TYPES):
+        assert np.all(np.abs(monthly_shares.sum(axis=-1) - 1.0) <= 0.005)
 
     return monthly_shares
 
 
-def calculate_hourly_performance_by_coefficients(hw_type: HotWaterType, annual_demand: float) -> npt.NDArray[float]:
+def calculate_hourly_performance_by_coefficients(hw_type: HotWaterType,
+                                                  annual_demand: npt.ArrayLike) -> npt.NDArray[float]:
     """
     For hot water heaters where energy demand isn't directly coupled to usage, apply a set of four
     three order polynomials to represent share of energy usage throughout the day.
 
     :param hw_type:
-    :param annual_demand:
-    :return:
+    :param annual_demand: A single annual demand, or an array of them
+    :return: Hourly share (24 points, or shape (N, 24) for N demands)
     """
 
-    def extract_coefficients(df, system_id):
-        row = df.loc[system_id]
-        a, b, c, d = row['ax'], row['bx'], row['cx'], row['dx']
-        return a, b, c, d
-
-    hourly_coefficients = pd.read_csv(here / "reference_data/hw_hourly_coefficients_rev10.1.csv",
-                                      index_col="System ID")
-
     # Get abbreviations used to describe HW type in data table
     if hw_type == HotWaterType.ELECTRIC_STORAGE_SMALL:
         row_code = 'ESS'
@@ -252,190 +428,192 @@ def calculate_hourly_performance_by_coefficients(hw_type: HotWaterType, annual_d
     else:
         raise NotImplementedError
 
-    # Look up coefficients from table
-    A_a, A_b, A_c, A_d = extract_coefficients(hourly_coefficients, f'{row_code}-A')
-    B_a, B_b, B_c, B_d = extract_coefficients(hourly_coefficients, f'{row_code}-B')
-    C_a, C_b, C_c, C_d = extract_coefficients(hourly_coefficients, f'{row_code}-C')
-    D_a, D_b, D_c, D_d = extract_coefficients(hourly_coefficients, f'{row_code}-D')
-
-    # Apply equation 31 to 34 from methods paper
-    component_A = (A_a * (annual_demand ** 3)) + (A_b * (annual_demand ** 2)) + (A_c * annual_demand) + A_d
-    component_B = (B_a * (annual_demand ** 3)) + (B_b * (annual_demand ** 2)) + (B_c * annual_demand) + B_d
-    component_C = (C_a * (annual_demand ** 3)) + (C_b * (annual_demand ** 2)) + (C_c * annual_demand) + C_d
-    component_D = (D_a * (annual_demand ** 3)) + (D_b * (annual_demand ** 2)) + (D_c * annual_demand) + D_d
-
-    # Hours of day for which each component applies (note that 1 = midnight)
-    hours_A = [1, 2, 3, 4, 5, 6, 7, 10, 11, 13, 15, 20, 21, 22, 23, 24]
-    hours_B = [12, 14]
-    hours_C = [16, 17, 18, 19]
-    hours_D = [8, 9]
-    assert len(hours_A + hours_B + hours_C + hours_D) == 24
-
-    # Assign components to each hour
-    hourly_share = []
-    for hour in range(1, 25):
-        if hour in hours_A:
-            hourly_share.append(component_A)
-        elif hour in hours_B:
-            hourly_share.append(component_B)
-        elif hour in hours_C:
-            hourly_share.append(component_C)
-        elif hour in hours_D:
-            hourly_share.append(component_D)
-        else:
-            raise AssertionError
+    # Look up coefficients from table (rows for components A to D)
+    coefficients = _HOURLY_COEFFICIENTS[row_code]
+
+    # Apply equation 31 to 34 from methods paper, evaluating all four component cubics at once, then assign
+    # components to each hour (np.take, so many demands stay C-ordered, one row of 24 hours per demand)
+    hourly_share = np.take(_evaluate_cubic(coefficients, np.asarray(annual_demand)[..., np.newaxis]), _HOUR_COMPONENTS,
+                           axis=-1)
 
     # Should add up to 1...
     # FIXME: Seem to need a bit of wiggle room due to lack of precision in table? Get original spreadsheet instead
-    assert math.isclose(sum(hourly_share), 1.0, abs_tol=0.01)
+    assert np.all(np.abs(hourly_share.sum(axis=-1) - 1.0) <= 0.01)
 
-    return np.array(hourly_share)
+    return hourly_share
 
 
 def calculate_hourly_share(hw_type: HotWaterType,
-                           annual_demand: float,
+                           annual_demand: npt.ArrayLike,
                            energisation_schedule :Optional[EnergisationSchedule]=None) -> npt.NDArray[float]:
     """
     Calculate what fraction of purchased energy is consumed by hour, over 24 hours.
 
+    Where shares don't depend on demand (fixed schedules, or coupled directly to hot water use), the same read-only
+    24 point profile is handed back for every call.
+
     :param hw_type: Hot water type
-    :param annual_demand: Annual hw demand. Not needed for all HW types.
+    :param annual_demand: Annual hw demand (or an array of them). Not needed for all HW types.
     :param energisation_schedule: Whether HW is continuously powered, or on schedule (not relevant for some HW types)
-    :return: Hourly share of purchased energy (24 points, summing to 1.00)
+    :return: Hourly share of purchased energy (24 points, summing to 1.00), or shape (N, 24) for N demands where shares
+    depend on demand.
     """
 
-    # N.B. 'Nominal hour number' starts at 1 rather than 0
-    hourly_share_data = pd.read_csv(here / "reference_data/hw_hourly_profiles_rev10.1.csv",
-                                    index_col="Nominal hour number")
+    if hw_type not in _HW_DISPATCH:
+        raise NotImplementedError
+
+    allowed_schedules, continuous_hourly_share = _HW_DISPATCH[hw_type]
+
+    if allowed_schedules is None:
+        return continuous_hourly_share(annual_demand)
 
     # Check energisation setting is valid for given hw type
-    if hw_type == HotWaterType.SOLID_FUEL:
-        # Standard unsure about this one, defaults to continuous...
-        energisation_schedule = EnergisationSchedule.CONTINUOUS
-    elif hw_type == HotWaterType.ELECTRIC_STORAGE_SMALL:
-        # Leave energisation_schedule as is... default to always on, but can run scheduled as well.
-        pass
-    elif hw_type == HotWaterType.ELECTRIC_STORAGE_LARGE:
-        # Don't have method for continuous (load dependent) for large electric storage.
-        if energisation_schedule == EnergisationSchedule.CONTINUOUS:
-            raise RuntimeError("ELECTRIC_STORAGE_LARGE needs to be run either daytime or overnight, not continuous.")
-    elif hw_type == HotWaterType.ELECTRIC_INSTANTANEOUS:
-        if energisation_schedule != EnergisationSchedule.CONTINUOUS:
-            raise RuntimeError("ELECTRIC_INSTANTANEOUS must run continuously.")
-    elif hw_type == HotWaterType.GAS_STORAGE:
-        if energisation_schedule != EnergisationSchedule.CONTINUOUS:
-            raise RuntimeError("GAS_STORAGE must run continuously. .")
-    elif hw_type == HotWaterType.GAS_INSTANTANEOUS:
-        if energisation_schedule != EnergisationSchedule.CONTINUOUS:
-            raise RuntimeError("GAS_INSTANTANEOUS must run continuously. .")
-    elif hw_type == HotWaterType.SOLAR_ELECTRIC:
-        # Leave energisation_schedule as is... default to always on, but can run scheduled as well.
-        pass
-    elif hw_type == HotWaterType.SOLAR_GAS:
-        if energisation_schedule != EnergisationSchedule.CONTINUOUS:
-            raise RuntimeError("SOLAR_GAS must run continuously. .")
-    elif hw_type == HotWaterType.HEAT_PUMP:
-        # Leave energisation_schedule as is... default to always on, but can run scheduled as well.
-        pass
-    elif hw_type == HotWaterType._SOLAR_GAS_AUXILIARY:
-        # Doesn't matter for aux load, ignore
-        pass
-    else:
-        raise NotImplementedError
+    if energisation_schedule not in allowed_schedules:
+        raise RuntimeError(f"{hw_type.name} can't run with energisation schedule {energisation_schedule}, must be one "
+                           f"of {sorted(schedule.name for schedule in allowed_schedules)}.")
 
-    if hw_type == HotWaterType._SOLAR_GAS_AUXILIARY:
-        # Special case for gas boosted solar auxiliary load, we're not looking at gas demand, just electricity for pump
-        # and a little bit of idle load.
-        hourly_share = hourly_share_data['Share auxiliary electricity energy for solar thermal gas systems'].values
-    else:
-        # Get hourly shares, based on fixed energisation schedule where relevant, coupled directly to HW demand, or based
-        # on more complex empirical model for storage systems.
-        if energisation_schedule == EnergisationSchedule.DAYTIME:
-            hourly_share = hourly_share_data['Daytime energisation by hour (share)'].values
-        elif energisation_schedule == EnergisationSchedule.OVERNIGHT:
-            hourly_share = hourly_share_data['Overnight energisation by hour (share)'].values
-        elif energisation_schedule == EnergisationSchedule.CONTINUOUS:
-            if hw_type in [HotWaterType.SOLID_FUEL, HotWaterType.ELECTRIC_INSTANTANEOUS, HotWaterType.GAS_INSTANTANEOUS,
-                           HotWaterType.SOLAR_GAS, HotWaterType.SOLAR_ELECTRIC]:
-                hourly_share = hourly_share_data['Time of Hot Water use by hour (share)'].values
-            elif hw_type in [HotWaterType.ELECTRIC_STORAGE_SMALL,
-                             HotWaterType.GAS_STORAGE,
-                             HotWaterType.HEAT_PUMP,
-                             HotWaterType._GAS_INSTANTANEOUS_AUXILIARY]:
-                # Hourly share depends on more complex model, not just driven by hot water demand or fixed schedule.
-                hourly_share = calculate_hourly_performance_by_coefficients(hw_type, annual_demand)
-            else:
-                raise NotImplementedError
-        else:
-            raise NotImplementedError
+    # Get hourly shares, based on fixed energisation schedule where relevant, coupled directly to HW demand, or based
+    # on more complex empirical model for storage systems.
+    if energisation_schedule == EnergisationSchedule.CONTINUOUS:
+        return continuous_hourly_share(annual_demand)
 
-    return hourly_share
+    return _SCHEDULED_HOURLY_SHARES[energisation_schedule]
 
-def calculate_hourly_energy_demand(dwelling_area: float,
-                                   postcode: str,
-                                   hw_type: HotWaterType,
-                                   stc_count: Optional[int] = None,
-                                   gas_star_rating: Optional[float] = None,
-                                   energisation_schedule: Optional[EnergisationSchedule] = EnergisationSchedule.CONTINUOUS,
-                                   include_aux_electric_load=False) -> Union[npt.NDArray[float],  Tuple[npt.NDArray[float], npt.NDArray[float]]]:
+
+def _distribute_annual_energy(annual_purchased_energy: npt.ArrayLike,
+                              monthly_share: npt.ArrayLike,
+                              hourly_share: npt.ArrayLike) -> npt.NDArray[float]:
     """
+    Spread annual purchased energy over the year, first by month and then by hour of day.
+    Works for a single dwelling, or many at once with one row per dwelling.
 
-    :param dwelling_area:
-    :param postcode:
+    :param annual_purchased_energy: Purchased energy in MJ/yr, shape () or (N,)
+    :param monthly_share: Share of annual energy by month, shape (12,) or (N, 12)
+    :param hourly_share: Share of daily energy by hour, shape (24,) or (N, 24)
+    :return: Hourly purchased energy, shape (8760,) or (N, 8760)
+    """
+
+    # Purchased energy per day in each month
+    day_purchased_energy = (np.asarray(monthly_share) * np.asarray(annual_purchased_energy)[..., np.newaxis]
+                            / MONTH_LENGTHS)
+
+    # Broadcast (days x 1) by (1 x hours) into days x hours, then flatten to hours of the year. np.take keeps days
+    # C-ordered (unlike fancy indexing on the last axis), so the product is too, and the flatten is just a view.
+    hourly_purchased_energy = (np.take(day_purchased_energy, MONTH_OF_DAY, axis=-1)[..., np.newaxis]
+                               * np.asarray(hourly_share)[..., np.newaxis, :])
+
+    return hourly_purchased_energy.reshape(*hourly_purchased_energy.shape[:-2], 8760)
+
+
+def calculate_hourly_energy_demand_batch(dwelling_areas: npt.ArrayLike,
+                                         postcodes: npt.ArrayLike,
+                                         hw_type: HotWaterType,
+                                         stc_count: Optional[int] = None,
+                                         gas_star_rating: Optional[float] = None,
+                                         energisation_schedule: Optional[EnergisationSchedule] = EnergisationSchedule.CONTINUOUS,
+                                         include_aux_electric_load=False) -> Union[npt.NDArray[float],  Tuple[npt.NDArray[float], npt.NDArray[float]]]:
+    """
+    Same as calculate_hourly_energy_demand, but for many dwellings with the same type of hot water system.
+
+    :param dwelling_areas: Floor area of each dwelling
+    :param postcodes: Postcode of each dwelling (same length as dwelling_areas)
     :param hw_type:
     :param stc_count:
     :param gas_star_rating:
     :param energisation_schedule:
-    :param include_aux_electric_load: Whether to return
-    :return:
+    :param include_aux_electric_load: Whether to also return auxiliary electric load (only for SOLAR_GAS)
+    :return: Hourly purchased energy, with one row of 8760 points per dwelling.
     """
 
-    occupants = calculate_occupants(dwelling_area)
-
-    climate_zone = get_climate_zone(postcode, hw_type)
-
-    annual_demand = calculate_annual_demand(calculate_winter_peak_demand(occupants, climate_zone))
+    if include_aux_electric_load and hw_type != HotWaterType.SOLAR_GAS:
+        raise NotImplementedError("Auxiliary electric load is only available for SOLAR_GAS.")
 
-    hw_type_code = get_hot_water_type_code(hw_type, climate_zone, gas_star_rating=gas_star_rating, stc_count=stc_count)
+    dwelling_areas = np.asarray(dwelling_areas, dtype=float)
+    postcodes = np.asarray(postcodes)
+    if dwelling_areas.ndim != 1 or dwelling_areas.shape != postcodes.shape:
+        raise ValueError("Need one dwelling area for each postcode.")
 
-    annual_purchased_energy = calculate_annual_purchased_energy(annual_demand, hw_type_code)
+    occupants = calculate_occupants(dwelling_areas)
 
-    monthly_share = calculate_monthly_share(hw_type_code, annual_demand)
+    climate_zones = get_climate_zones(postcodes, hw_type)
 
-    hourly_share = calculate_hourly_share(hw_type, annual_demand,
-                                          energisation_schedule=energisation_schedule)
-
-    hourly_purchased_energy = np.array([])
+    annual_demand = calculate_annual_demand(calculate_winter_peak_demand(occupants, climate_zones))
 
+    # Type code (and so purchased energy coefficients and monthly shares) only depends on climate zone for a given hot
+    # water system, so look these up once per zone rather than once per dwelling, and evaluate cubics for every dwelling
+    # in the zone in one pass.
+    annual_energy_coefficients = np.empty((len(climate_zones), 4))
+    monthly_shares = np.empty((len(climate_zones), 12))
     if hw_type == HotWaterType.SOLAR_GAS:
-        aux_monthly_share = calculate_monthly_share(f"STX-{climate_zone}", annual_demand)
-        aux_hourly_share = calculate_hourly_share(HotWaterType._SOLAR_GAS_AUXILIARY, 0)
-        aux_hourly_purchased_energy = np.array([])
-
-    for month_index in range(12):
-        _, month_length = monthrange(2022, month_index + 1)
+        aux_monthly_shares = np.empty((len(climate_zones), 12))
+
+    for climate_zone in np.unique(climate_zones):
+        in_zone = climate_zones == climate_zone
+        hw_type_code = get_hot_water_type_code(hw_type, int(climate_zone),
+                                               gas_star_rating=gas_star_rating, stc_count=stc_count)
+        annual_energy_coefficients[in_zone] = _get_annual_energy_coefficients(hw_type_code)
+        monthly_shares[in_zone] = calculate_monthly_share(hw_type_code, annual_demand[in_zone])
+        if hw_type == HotWaterType.SOLAR_GAS:
+            aux_monthly_shares[in_zone] = calculate_monthly_share(f"STX-{climate_zone}", annual_demand[in_zone])
 
-        month_purchased_energy = monthly_share[month_index] * annual_purchased_energy
-        day_purchased_energy = month_purchased_energy / month_length
+    annual_purchased_energy = _evaluate_cubic(annual_energy_coefficients, annual_demand)
 
-        hourly_purchased_energy_for_month = np.tile(hourly_share * day_purchased_energy, month_length)
-        hourly_purchased_energy = np.concatenate((hourly_purchased_energy, hourly_purchased_energy_for_month))
+    # Hourly shares don't depend on zone, so get them for all dwellings at once (a single 24 point profile when they
+    # don't depend on demand either), then spread energy over the year for all dwellings at once.
+    hourly_shares = calculate_hourly_share(hw_type, annual_demand, energisation_schedule)
 
-        if hw_type == HotWaterType.SOLAR_GAS:
-            aux_month_purchased_energy = aux_monthly_share[month_index] * annual_purchased_energy
-            aux_day_purchased_energy = aux_month_purchased_energy / month_length
+    hourly_purchased_energy = _distribute_annual_energy(annual_purchased_energy, monthly_shares, hourly_shares)
 
-            aux_hourly_purchased_energy_for_month = np.tile(aux_hourly_share * aux_day_purchased_energy, month_length)
-            aux_hourly_purchased_energy = np.concatenate((aux_hourly_purchased_energy, aux_hourly_purchased_energy_for_month))
+    if hw_type == HotWaterType.SOLAR_GAS:
+        aux_hourly_share = calculate_hourly_share(HotWaterType._SOLAR_GAS_AUXILIARY, 0, None)
+        aux_hourly_purchased_energy = _distribute_annual_energy(annual_purchased_energy,
+                                                                aux_monthly_shares,
+                                                                aux_hourly_share)
 
+    # Hourly energy adds up to annual energy times sum of monthly shares times sum of hourly shares, so check the shares
+    # rather than summing every hour of the year.
     if hw_type == HotWaterType.SOLAR_GAS:
         # Have to check sum of gas and electricity demand matches annual total, not just gas.
-        assert math.isclose(sum(hourly_purchased_energy) + sum(aux_hourly_purchased_energy), annual_purchased_energy, rel_tol=0.005)
+        assert np.allclose(monthly_shares.sum(axis=1) * hourly_shares.sum(axis=-1)
+                           + aux_monthly_shares.sum(axis=1) * aux_hourly_share.sum(), 1.0, rtol=0, atol=0.005)
     else:
         # Allow 0.5% tolerance... data table precision is imperfect.
-        assert math.isclose(sum(hourly_purchased_energy), annual_purchased_energy, rel_tol=0.01)
+        assert np.allclose(monthly_shares.sum(axis=1) * hourly_shares.sum(axis=-1), 1.0, rtol=0, atol=0.01)
 
     if include_aux_electric_load:
         return hourly_purchased_energy, aux_hourly_purchased_energy
     else:
         return hourly_purchased_energy
+
+
+@cache_read_only()
+def calculate_hourly_energy_demand(dwelling_area: float,
+                                   postcode: str,
+                                   hw_type: HotWaterType,
+                                   stc_count: Optional[int] = None,
+                                   gas_star_rating: Optional[float] = None,
+                                   energisation_schedule: Optional[EnergisationSchedule] = EnergisationSchedule.CONTINUOUS,
+                                   include_aux_electric_load=False) -> Union[npt.NDArray[float],  Tuple[npt.NDArray[float], npt.NDArray[float]]]:
+    """
+
+    :param dwelling_area:
+    :param postcode:
+    :param hw_type:
+    :param stc_count:
+    :param gas_star_rating:
+    :param energisation_schedule:
+    :param include_aux_electric_load: Whether to return
+    :return:
+    """
+
+    result = calculate_hourly_energy_demand_batch([dwelling_area], [int(postcode)], hw_type,
+                                                  stc_count=stc_count,
+                                                  gas_star_rating=gas_star_rating,
+                                                  energisation_schedule=energisation_schedule,
+                                                  include_aux_electric_load=include_aux_electric_load)
+
+    if include_aux_electric_load:
+        hourly_purchased_energy, aux_hourly_purchased_energy = result
+        return hourly_purchased_energy[0], aux_hourly_purchased_energy[0]
+    else:
+        return result[0]
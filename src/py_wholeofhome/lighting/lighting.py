@@ -1,10 +1,14 @@
+import numpy as np
+import numpy.typing as npt
 from pathlib import Path
 
-from ..utilities import get_hourly_shares
+from ..utilities import load_hourly_share_fractions, cache_read_only
 
 
 here = Path(__file__).parent
 
+HOURLY_SHARES = load_hourly_share_fractions(here / 'reference_data/lighting_hourly_share_rev10.1.csv')
+
 
 def calculate_annual_load(dwelling_area: float) -> float:
     """
@@ -20,10 +24,13 @@ def calculate_annual_load(dwelling_area: float) -> float:
     return lighting_density * run_time * dwelling_area * 365 * 3.6 / 1000
 
 
-def calculate_hourly_energy_demand(dwelling_area: float) -> [float]:
+@cache_read_only()
+def calculate_hourly_energy_demand(dwelling_area: float, dtype: npt.DTypeLike = np.float64) -> npt.NDArray[float]:
+    """
 
-    annual_load = calculate_annual_load(dwelling_area)
-    hourly_shares = get_hourly_shares(here / 'reference_data/lighting_hourly_share_rev10.1.csv')
-    hourly_annual_load = hourly_shares * annual_load / 100
+    :param dwelling_area:
+    :param dtype: Float type of result, e.g. np.float32 to halve memory when aggregating many dwellings
+    :return: Hourly lighting demand in MJ (8760 points)
+    """
 
-    return hourly_annual_load
\ No newline at end of file
+    return np.multiply(HOURLY_SHARES, calculate_annual_load(dwelling_area), dtype=dtype)
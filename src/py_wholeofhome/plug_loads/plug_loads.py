@@ -1,10 +1,14 @@
+import numpy as np
+import numpy.typing as npt
 from pathlib import Path
 
-from ..utilities import get_hourly_shares
+from ..utilities import load_hourly_share_fractions, cache_read_only
 
 
 here = Path(__file__).parent
 
+HOURLY_SHARES = load_hourly_share_fractions(here / 'reference_data/plug_load_hourly_share_rev10.1.csv')
+
 
 def calculate_annual_load(occupants: float) -> float:
     """
@@ -16,10 +20,13 @@ def calculate_annual_load(occupants: float) -> float:
     return 7022.4 + (occupants * 441.65)
 
 
-def calculate_hourly_energy_demand(occupants: float) -> [float]:
+@cache_read_only()
+def calculate_hourly_energy_demand(occupants: float, dtype: npt.DTypeLike = np.float64) -> npt.NDArray[float]:
+    """
 
-    annual_load = calculate_annual_load(occupants)
-    hourly_shares = get_hourly_shares(here / 'reference_data/plug_load_hourly_share_rev10.1.csv')
-    hourly_annual_load = hourly_shares * annual_load / 100
+    :param occupants: Number of occupants per equation 2 (i.e. can be fractional!)
+    :param dtype: Float type of result, e.g. np.float32 to halve memory when aggregating many dwellings
+    :return: Hourly plug load in MJ (8760 points)
+    """
 
-    return hourly_annual_load
+    return np.multiply(HOURLY_SHARES, calculate_annual_load(occupants), dtype=dtype)
@@ -3,21 +3,92 @@ import numpy as np
 import numpy.typing as npt
 import pandas as pd
 from calendar import monthrange
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import Tuple
 
 
-def calculate_occupants(dwelling_area: float) -> float:
+here = Path(__file__).parent
+
+# Days in each month (of a non leap year, as used throughout), and index of month (0 to 11) for each day of the year.
+MONTH_LENGTHS = np.array([monthrange(2022, month)[1] for month in range(1, 13)])
+MONTH_OF_DAY = np.repeat(np.arange(12), MONTH_LENGTHS)
+
+
+def _load_nathers_zones(reference_file: Path) -> dict:
+    """
+    Load primary NatHERS climate zone by postcode.
+
+    :param reference_file: NatHERS climate zone CSV, with a row per postcode (plus some footnotes at the end)
+    :return: Dict of primary NatHERS climate zone by postcode
+    """
+
+    data = pd.read_csv(reference_file, usecols=[0, 1])
+    data.columns = ['Postcode', 'Primary']
+
+    # Drop footnotes and blank rows
+    data = data[pd.to_numeric(data['Postcode'], errors='coerce').notna() & data['Primary'].notna()]
+
+    return dict(zip(data['Postcode'].astype(int), data['Primary'].astype(int)))
+
+
+# NatHERS climate zones by postcode, loaded once at import rather than on every call.
+_NATHERS_ZONES = _load_nathers_zones(here / 'reference_data/NatHERSclimatezonesNov2019_0.csv')
+
+
+def cache_read_only(maxsize: int = 512):
+    """
+    Memoise a function returning numpy arrays (or a tuple of them) on its arguments, which must be hashable.
+    The same arrays are returned to every caller with the same arguments, so they're made read-only.
+
+    :param maxsize: Maximum number of results to keep
+    :return: Decorator
+    """
+
+    def decorator(func):
+        @lru_cache(maxsize=maxsize)
+        @wraps(func)
+        def cached(*args, **kwargs):
+            result = func(*args, **kwargs)
+            for array in (result if isinstance(result, tuple) else (result,)):
+                array.setflags(write=False)
+            return result
+
+        return cached
+
+    return decorator
+
+
+def calculate_occupants(dwelling_area: npt.ArrayLike) -> npt.ArrayLike:
     """
     Calculate number of occupants, per Equation 2.
 
-    :param dwelling_area: Floor area of all zones, excluding garage.
+    :param dwelling_area: Floor area of all zones, excluding garage. A single area, or an array of them.
     :return: Number of occupants, rounded to 2nd decimal place (bizarre!)
     """
 
+    if np.ndim(dwelling_area) == 0:
+        return _calculate_occupants_scalar(float(dwelling_area))
+
     occupants = 1.525 * np.log(dwelling_area) - 4.533
 
     return np.round(np.clip(occupants, 1, 6), decimals=2)
 
 
+@lru_cache(maxsize=256)
+def _calculate_occupants_scalar(dwelling_area: float) -> float:
+    # Plain floats are much cheaper than numpy scalars here, and sweeps tend to revisit the same areas.
+    # Match numpy for areas math.log can't take: log(0) is -inf (so clamped to 1), negative (or NaN) areas give NaN.
+    if dwelling_area == 0:
+        return 1.0
+    if not dwelling_area > 0:
+        return math.nan
+
+    occupants = 1.525 * math.log(dwelling_area) - 4.533
+
+    return round(max(1.0, min(6.0, occupants)), 2)
+
+
 def get_hourly_shares(reference_file: str) -> npt.NDArray[float]:
     """
     Get hour-by-hour share of annual load for a whole year (8760 points)
@@ -25,18 +96,13 @@ def get_hourly_shares(reference_file: str) -> npt.NDArray[float]:
     :return:
     """
 
-    hourly_shares_by_month = pd.read_csv(reference_file)
-    annual_shares = np.array([])
+    # Hourly shares as a 24 x 12 array (hour of day x month), skipping header row and hour column.
+    # It's just a small table of floats, so no need for pandas here.
+    hourly_shares_by_month = np.loadtxt(reference_file, delimiter=',', skiprows=1, usecols=range(1, 13))
+    assert hourly_shares_by_month.shape == (24, 12)
 
-    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-
-    # Build an array mapping hourly shares for each month to a whole year
-    # Probably not super efficient, but can always memoise yearly array later to speed up.
-    for month_index, month in enumerate(months):
-        _, month_length = monthrange(2022, month_index + 1)
-
-        monthly_shares = np.tile(hourly_shares_by_month[month].values, month_length)
-        annual_shares = np.concatenate((annual_shares, monthly_shares))
+    # Repeat each month's 24 hourly shares for every day of that month, to map them to a whole year.
+    annual_shares = np.repeat(hourly_shares_by_month.T, MONTH_LENGTHS, axis=0).reshape(-1)
 
     assert len(annual_shares) == 8760
 
@@ -45,11 +111,50 @@ def get_hourly_shares(reference_file: str) -> npt.NDArray[float]:
     return annual_shares
 
 
-def get_nathers_zone(postcode: int) -> int:
-    nathers_zone_data = pd.read_csv('utilities/reference_data/NatHERSclimatezonesNov2019_0.csv',
-                                    index_col='Postcode')
-    return nathers_zone_data.loc[postcode]['Primary']
+def load_hourly_share_fractions(reference_file: Path) -> npt.NDArray[float]:
+    """
+    Load hour-by-hour shares of annual load for a whole year as fractions (rather than %), once per end use at import.
+    The same array is used for every call, so it's read-only.
+
+    :param reference_file: Filename of CSV containing hourly factors, as for get_hourly_shares
+    :return: Hourly shares as fractions of annual load (8760 points, summing to 1)
+    """
 
+    shares = get_hourly_shares(reference_file) / 100
+    shares.setflags(write=False)
 
+    return shares
+
+
+def sum_hourly(*pairs: Tuple[npt.NDArray[float], float]) -> npt.NDArray[float]:
+    """
+    Sum several scaled hourly profiles into a single whole-of-home profile, e.g. hourly shares of each end use
+    multiplied by its annual load, without allocating an intermediate array for each end use.
 
+    :param pairs: (hourly profile, scale) pairs, e.g. (lighting.HOURLY_SHARES, lighting.calculate_annual_load(area)).
+    All profiles must be the same length (normally 8760 points).
+    :return: Sum of each profile multiplied by its scale
+    """
+
+    if not pairs:
+        raise ValueError("Need at least one (hourly profile, scale) pair to sum.")
+
+    out = np.zeros(len(pairs[0][0]))
+    scaled = np.empty_like(out)
+
+    for profile, scale in pairs:
+        np.multiply(profile, scale, out=scaled)
+        out += scaled
+
+    return out
+
+
+def get_nathers_zone(postcode: int) -> int:
+    """
+    Get primary NatHERS climate zone for given postcode.
+
+    :param postcode: Australian postcode.
+    :return: NatHERS climate zone (1 to 69)
+    """
 
+    return _NATHERS_ZONES[postcode]
@@ -30,6 +30,17 @@ class OvenTests(unittest.TestCase):
         self.assertAlmostEqual(annual_load, 853, delta=1)
 
 
+class CookingTests(unittest.TestCase):
+    def test_hourly(self):
+        dwelling_area = 200     # 3.55 occupants
+
+        hourly_cooktop, hourly_oven = calculate_hourly_energy_demand(dwelling_area, CooktopType.GAS, OvenType.ELECTRIC)
+        self.assertEqual(len(hourly_cooktop), 8760)
+        self.assertEqual(len(hourly_oven), 8760)
+        self.assertAlmostEqual(sum(hourly_cooktop), calculate_cooktop_annual_load(3.55, CooktopType.GAS), places=3)
+        self.assertAlmostEqual(sum(hourly_oven), calculate_oven_annual_load(3.55, OvenType.ELECTRIC), places=3)
+
+
     # def test_hourly(self):
     #     occupants = 2.5
     #     hourly = calculate_hourly_energy_demand(occupants)
@@ -0,0 +1,42 @@
+import math
+import unittest
+
+from py_wholeofhome.heating_cooling.heating_cooling import get_gems_zone, get_default_star_rating, \
+    calculate_hourly_energy_demand, HeatingCoolingType, HeatingCoolingLossType, DEFAULT_STAR_RATINGS, \
+    GAS_DUCTED_COPS, GAS_NON_DUCTED_COPS
+
+
+class HeatingCoolingTests(unittest.TestCase):
+    def test_gems_zone(self):
+        self.assertEqual(get_gems_zone(2000), "Mixed")
+        self.assertEqual(get_gems_zone(3000), "Cold")
+        self.assertEqual(get_gems_zone(800), "Hot/humid")
+
+    def test_default_star_rating(self):
+        self.assertEqual(get_default_star_rating(2000)["heating"], 3.5)
+        self.assertEqual(get_default_star_rating(3000)["heating"], 2.5)
+        self.assertEqual(get_default_star_rating(800)["heating"], 4.0)
+
+        # Callers get their own copy, so changing it mustn't change the defaults
+        star_ratings = get_default_star_rating(2000)
+        star_ratings["heating"] = 6
+        self.assertEqual(DEFAULT_STAR_RATINGS["Mixed"]["heating"], 3.5)
+        self.assertEqual(get_default_star_rating(2000)["heating"], 3.5)
+
+    def test_gas_cops(self):
+        # Equation 22 up to 3 stars, equation 23 above
+        self.assertAlmostEqual(GAS_DUCTED_COPS[30], 0.7)
+        self.assertAlmostEqual(GAS_DUCTED_COPS[45], 0.357892 + 0.3114 * math.log(4.5))
+        self.assertAlmostEqual(GAS_NON_DUCTED_COPS[40], 0.61 + 0.06 * 3)
+
+    def test_gas_star_rating(self):
+        for loss_type in [HeatingCoolingLossType.DUCTED_NEW, HeatingCoolingLossType.NON_DUCTED]:
+            # Defaults to 3 stars if not given
+            calculate_hourly_energy_demand(2000, None, None, HeatingCoolingType.GAS, loss_type,
+                                           heating_star_rating=None)
+
+            # Only half star increments, up to 6 stars
+            for star_rating in [6.5, 2.25]:
+                with self.assertRaises(NotImplementedError):
+                    calculate_hourly_energy_demand(2000, None, None, HeatingCoolingType.GAS, loss_type,
+                                                   heating_star_rating=star_rating)
@@ -1,10 +1,26 @@
 import unittest
 
+import numpy as np
+
 from py_wholeofhome.hot_water import calculate_annual_purchased_energy, calculate_hourly_energy_demand, calculate_annual_demand, \
-    HotWaterType, calculate_winter_peak_demand, get_hot_water_type_code
+    HotWaterType, calculate_winter_peak_demand, get_hot_water_type_code, get_climate_zone, \
+    get_climate_zones, calculate_hourly_energy_demand_batch, calculate_hourly_share, EnergisationSchedule
 
 
 class HotWaterTests(unittest.TestCase):
+    def test_climate_zone(self):
+        self.assertEqual(get_climate_zone(2000, HotWaterType.SOLAR_ELECTRIC), 3)
+        self.assertEqual(get_climate_zone(4870, HotWaterType.HEAT_PUMP), 1)
+        self.assertEqual(get_climate_zone(4825, HotWaterType.HEAT_PUMP), 2)
+
+        # Ends of postcode ranges
+        self.assertEqual(get_climate_zone(800, HotWaterType.GAS_STORAGE), 1)
+        self.assertEqual(get_climate_zone(854, HotWaterType.GAS_STORAGE), 1)
+        self.assertEqual(get_climate_zone(860, HotWaterType.GAS_STORAGE), 2)
+
+        with self.assertRaises(ValueError):
+            get_climate_zone(9999, HotWaterType.GAS_STORAGE)
+
     def test_example_1_unit(self):
         # From worked example 1, p81 of methods paper.
 
@@ -161,4 +177,105 @@ class HotWaterTests(unittest.TestCase):
         # Very large home
         dwelling_area = 750
         hourly = calculate_hourly_energy_demand(dwelling_area, postcode, hw_type, gas_star_rating=gas_star_rating)
-        self.assertAlmostEqual(sum(hourly), 25464, delta=5)  # More wobbble...
\ No newline at end of file
+        self.assertAlmostEqual(sum(hourly), 25464, delta=5)  # More wobbble...
+
+    def test_climate_zones(self):
+        # Many postcodes at once, as strings or integers, should match one at a time lookups.
+        postcodes = ["800", "2000", "3000", "4825", "4870", "7470"]
+        for hw_type in [HotWaterType.GAS_STORAGE, HotWaterType.HEAT_PUMP]:
+            zones = get_climate_zones(postcodes, hw_type)
+            self.assertEqual(list(zones), [get_climate_zone(int(postcode), hw_type) for postcode in postcodes])
+            self.assertEqual(list(get_climate_zones([int(p) for p in postcodes], hw_type)), list(zones))
+
+        with self.assertRaises(ValueError):
+            get_climate_zones(["2000", "9999"], HotWaterType.GAS_STORAGE)
+
+    def test_winter_peak_demand_invalid_zone(self):
+        for climate_zone in [0, 6]:
+            with self.assertRaises(ValueError):
+                calculate_winter_peak_demand(3, climate_zone)
+
+        with self.assertRaises(ValueError):
+            calculate_winter_peak_demand(np.array([3, 3]), np.array([1, 0]))
+
+    def test_missing_coefficients(self):
+        # Table has placeholder strings rather than coefficients for some systems
+        with self.assertRaises(RuntimeError):
+            calculate_annual_purchased_energy(9.1782, "SHP-3-20")
+
+    def test_batch(self):
+        dwelling_areas = [150, 200, 750]
+        postcodes = ["2000", "4870", "3000"]
+        hw_type = HotWaterType.HEAT_PUMP
+        stc_count = 30
+
+        hourly = calculate_hourly_energy_demand_batch(dwelling_areas, postcodes, hw_type, stc_count=stc_count)
+        self.assertEqual(hourly.shape, (3, 8760))
+
+        # Flattened from a days x hours block without copying
+        self.assertTrue(hourly.flags.c_contiguous)
+        self.assertIsNotNone(hourly.base)
+        self.assertTrue(np.shares_memory(hourly, hourly.base))
+
+        # Each row should match the single dwelling calculation
+        for i in range(3):
+            single = calculate_hourly_energy_demand(dwelling_areas[i], postcodes[i], hw_type, stc_count=stc_count)
+            self.assertTrue((hourly[i] == single).all())
+
+    def test_batch_mismatched_lengths(self):
+        for dwelling_areas, postcodes in [([100, 300, 400], ["2000"]), ([100], ["2000", "3000", "4870"])]:
+            with self.assertRaises(ValueError):
+                calculate_hourly_energy_demand_batch(dwelling_areas, postcodes, HotWaterType.HEAT_PUMP, stc_count=30)
+
+    def test_batch_solar_gas(self):
+        # Demand dependent monthly shares, plus auxiliary load, across several zones
+        dwelling_areas = [150, 200, 750, 90]
+        postcodes = ["2000", "4870", "3000", "2000"]
+
+        hourly, aux = calculate_hourly_energy_demand_batch(dwelling_areas, postcodes, HotWaterType.SOLAR_GAS,
+                                                           stc_count=38, include_aux_electric_load=True)
+        self.assertEqual(hourly.shape, (4, 8760))
+        self.assertEqual(aux.shape, (4, 8760))
+
+        for i in range(4):
+            single, single_aux = calculate_hourly_energy_demand(dwelling_areas[i], postcodes[i], HotWaterType.SOLAR_GAS,
+                                                                stc_count=38, include_aux_electric_load=True)
+            self.assertTrue(np.allclose(hourly[i], single, rtol=1e-12, atol=0))
+            self.assertTrue(np.allclose(aux[i], single_aux, rtol=1e-12, atol=0))
+
+    def test_hourly_share_profiles_shared(self):
+        # Shares that don't depend on demand are the same read-only array, whatever the demand
+        share = calculate_hourly_share(HotWaterType.SOLAR_ELECTRIC, 10.0, EnergisationSchedule.CONTINUOUS)
+        self.assertIs(calculate_hourly_share(HotWaterType.SOLAR_ELECTRIC, 20.0, EnergisationSchedule.CONTINUOUS), share)
+        self.assertFalse(share.flags.writeable)
+
+        # Shares by coefficients can be calculated for many demands at once
+        demands = np.array([5.0, 10.0, 20.0])
+        shares = calculate_hourly_share(HotWaterType.HEAT_PUMP, demands, EnergisationSchedule.CONTINUOUS)
+        self.assertEqual(shares.shape, (3, 24))
+        for demand, share in zip(demands, shares):
+            self.assertTrue((calculate_hourly_share(HotWaterType.HEAT_PUMP, demand,
+                                                    EnergisationSchedule.CONTINUOUS) == share).all())
+            self.assertAlmostEqual(share.sum(), 1.0, delta=0.01)
+
+    def test_hourly_share_schedules(self):
+        # Large electric storage only runs to a fixed schedule
+        with self.assertRaises(RuntimeError):
+            calculate_hourly_share(HotWaterType.ELECTRIC_STORAGE_LARGE, 10.0, EnergisationSchedule.CONTINUOUS)
+
+        # Instantaneous and gas storage only run continuously
+        for hw_type in [HotWaterType.ELECTRIC_INSTANTANEOUS, HotWaterType.GAS_STORAGE]:
+            with self.assertRaises(RuntimeError):
+                calculate_hourly_share(hw_type, 10.0, EnergisationSchedule.DAYTIME)
+
+        # Solid fuel ignores schedule, and always follows hot water use
+        self.assertTrue((calculate_hourly_share(HotWaterType.SOLID_FUEL, 10.0, EnergisationSchedule.DAYTIME)
+                         == calculate_hourly_share(HotWaterType.SOLID_FUEL, 10.0,
+                                                   EnergisationSchedule.CONTINUOUS)).all())
+        self.assertFalse((calculate_hourly_share(HotWaterType.SOLID_FUEL, 10.0, EnergisationSchedule.DAYTIME)
+                          == calculate_hourly_share(HotWaterType.SOLAR_ELECTRIC, 10.0,
+                                                    EnergisationSchedule.DAYTIME)).all())
+
+        # Gas instantaneous auxiliary load isn't available on its own
+        with self.assertRaises(NotImplementedError):
+            calculate_hourly_share(HotWaterType._GAS_INSTANTANEOUS_AUXILIARY, 10.0, EnergisationSchedule.CONTINUOUS)
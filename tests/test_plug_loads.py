@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from py_wholeofhome.plug_loads import calculate_annual_load, calculate_hourly_energy_demand
 
 
@@ -13,3 +15,18 @@ class PlugLoadsTest(unittest.TestCase):
         occupants = 3
         hourly = calculate_hourly_energy_demand(occupants)
         self.assertAlmostEqual(sum(hourly), 8353, delta=6)
+
+    def test_hourly_float32(self):
+        occupants = 3
+        hourly = calculate_hourly_energy_demand(occupants, dtype=np.float32)
+        self.assertEqual(hourly.dtype, np.float32)
+        self.assertAlmostEqual(float(hourly.sum()), 8353, delta=6)
+
+    def test_hourly_cached(self):
+        occupants = 3
+        hourly = calculate_hourly_energy_demand(occupants)
+        self.assertIs(calculate_hourly_energy_demand(occupants), hourly)
+
+        # Cached result is shared between callers, so shouldn't be modifiable
+        with self.assertRaises(ValueError):
+            hourly[0] = 0
@@ -0,0 +1,57 @@
+import unittest
+
+import numpy as np
+
+from py_wholeofhome import cooking, lighting, plug_loads
+from py_wholeofhome.utilities import sum_hourly, calculate_occupants, get_nathers_zone
+
+
+class SumHourlyTests(unittest.TestCase):
+    def test_sum_hourly(self):
+        a = np.full(8760, 1 / 8760)
+        b = np.linspace(0, 1, 8760)
+
+        total = sum_hourly((a, 100), (b, 2), (b, 0.5))
+        self.assertEqual(len(total), 8760)
+        self.assertTrue(np.allclose(total, a * 100 + b * 2.5))
+
+    def test_sum_end_uses(self):
+        # Whole of home lighting and plug loads, from each end use's shares and annual load
+        total = sum_hourly((lighting.HOURLY_SHARES, lighting.calculate_annual_load(200)),
+                           (plug_loads.HOURLY_SHARES, plug_loads.calculate_annual_load(3)))
+        self.assertTrue(np.allclose(total, lighting.calculate_hourly_energy_demand(200)
+                                    + plug_loads.calculate_hourly_energy_demand(3)))
+
+    def test_hourly_share_fractions(self):
+        # Each end use's shares are fractions of annual load, shared read-only
+        for end_use in [cooking, lighting, plug_loads]:
+            self.assertEqual(len(end_use.HOURLY_SHARES), 8760)
+            self.assertAlmostEqual(end_use.HOURLY_SHARES.sum(), 1, delta=0.00001)
+            self.assertFalse(end_use.HOURLY_SHARES.flags.writeable)
+
+    def test_sum_nothing(self):
+        with self.assertRaises(ValueError):
+            sum_hourly()
+
+
+class OccupantsTests(unittest.TestCase):
+    def test_scalar_matches_array(self):
+        areas = [10, 50, 123.4, 200, 1000]
+
+        self.assertEqual([calculate_occupants(area) for area in areas], list(calculate_occupants(np.array(areas))))
+        self.assertEqual(calculate_occupants(10), 1)
+        self.assertEqual(calculate_occupants(1000), 6)
+
+        # Same for areas outside log's domain: zero clamps to 1 occupant, negative is NaN
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.assertEqual(calculate_occupants(0), 1)
+            self.assertEqual(list(calculate_occupants(np.array([0.0]))), [1])
+            self.assertTrue(np.isnan(calculate_occupants(-10)))
+            self.assertTrue(np.isnan(calculate_occupants(np.array([-10.0]))).all())
+
+
+class NathersZoneTests(unittest.TestCase):
+    def test_nathers_zone(self):
+        self.assertEqual(get_nathers_zone(800), 1)
+        self.assertEqual(get_nathers_zone(2000), 17)
+        self.assertEqual(get_nathers_zone(3000), 21)